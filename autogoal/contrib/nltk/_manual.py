@@ -1,5 +1,11 @@
+import functools
+import os
+from concurrent.futures import ThreadPoolExecutor
+
 import nltk
+import numpy as np
 from gensim.models.doc2vec import Doc2Vec as _Doc2Vec
+from gensim.models.doc2vec import TaggedDocument as _TaggedDocument
 
 from numpy import inf, nan
 
@@ -16,6 +22,22 @@ from autogoal.utils import nice_repr
 from autogoal.kb import AlgorithmBase
 
 
+class _TaggedCorpus:
+    """Re-iterable corpus of tagged documents for `Doc2Vec`.
+
+    Documents are tokenized lazily on every pass, instead of keeping
+    all of them in memory at once.
+    """
+
+    def __init__(self, X, tokenize):
+        self.X = X
+        self.tokenize = tokenize
+
+    def __iter__(self):
+        for i, x in enumerate(self.X):
+            yield _TaggedDocument(self.tokenize(x), [str(i)])
+
+
 @nice_repr
 class Doc2Vec(_Doc2Vec, SklearnTransformer):
     def __init__(
@@ -53,7 +75,7 @@ class Doc2Vec(_Doc2Vec, SklearnTransformer):
     def tokenize(self, sentence):
         sentence = sentence.lower() if self.lowercase else sentence
         tokens = self.inner_tokenizer.run(sentence)
-        tokens = self.inner_stopwords.run(sentence) if self.stopwords_remove else tokens
+        tokens = self.inner_stopwords.run(tokens) if self.stopwords_remove else tokens
         return [self.inner_stemmer.run(token) for token in tokens]
 
     def fit_transform(self, X, y=None):
@@ -63,12 +85,7 @@ class Doc2Vec(_Doc2Vec, SklearnTransformer):
     def fit(self, X, y):
         # Data must be turned to tagged data as TaggedDocument(Seq[Token), Tag)
         # Tag use to be an unique integer
-
-        from gensim.models.doc2vec import TaggedDocument as _TaggedDocument
-
-        tagged_data = [
-            _TaggedDocument(self.tokenize(X[i]), str(i)) for i in range(len(X))
-        ]
+        tagged_data = _TaggedCorpus(X, self.tokenize)
 
         self.build_vocab(tagged_data)
         return self.train(
@@ -76,7 +93,11 @@ class Doc2Vec(_Doc2Vec, SklearnTransformer):
         )
 
     def transform(self, X, y=None):
-        return [self.infer_vector(x) for x in X]
+        documents = [self.tokenize(x) for x in X]
+
+        # `infer_vector` releases the GIL, so documents can be inferred concurrently
+        with ThreadPoolExecutor(max_workers=min(8, os.cpu_count() or 1)) as executor:
+            return list(executor.map(self.infer_vector, documents))
 
     def run(self, input: Seq[Sentence]) -> MatrixContinuousDense:
         """This methods receive a document list and transform this into a dense continuous matrix.
@@ -84,6 +105,15 @@ class Doc2Vec(_Doc2Vec, SklearnTransformer):
         return SklearnTransformer.run(self, input)
 
 
+@functools.lru_cache(maxsize=None)
+def _load_stopwords(language):
+    # A new instance is built for every sampled pipeline, so each language
+    # is read from disk only once per process.
+    from nltk.corpus import stopwords
+
+    return frozenset(stopwords.words(language))
+
+
 @nice_repr
 class StopwordRemover(SklearnTransformer):
     def __init__(
@@ -106,13 +136,11 @@ class StopwordRemover(SklearnTransformer):
         ),
     ):
         self.language = language
-        from nltk.corpus import stopwords
-
-        self.words = stopwords.words(language)
+        self.words = _load_stopwords(language)
         SklearnTransformer.__init__(self)
 
     def fit_transform(self, X, y=None):
-        return [word for word in input if word not in self.words]
+        return [word for word in X if word not in self.words]
 
     def transform(self, X, y=None):
         return self.fit_transform(X, y)
@@ -134,25 +162,33 @@ class TextLowerer(SklearnTransformer):
         return [str.lower(x) for x in X]
 
 
+# Words repeat a lot within a corpus, so WordNet lookups are memoized
+# to avoid hitting NLTK's on-disk index for every occurrence.
+
+
+@functools.lru_cache(maxsize=65536)
+def _synset_names(word):
+    from nltk.corpus import wordnet
+
+    return tuple(synset.name() for synset in wordnet.synsets(word))
+
+
+@functools.lru_cache(maxsize=65536)
+def _senti_synset(synset):
+    from nltk.corpus import sentiwordnet
+
+    return sentiwordnet.senti_synset(synset)
+
+
 @nice_repr
 class WordnetConcept(AlgorithmBase):
     """Find a word in Wordnet and return a List of Synset de Wordnet
     """
 
-    def __init__(self):
-        from nltk.corpus import wordnet
-
-        self.wordnet = wordnet
-
     def run(self, input: Word) -> Seq[Synset]:
         """Find a word in Wordnet and return a List of Synset de Wordnet
         """
-        synsets = self.wordnet.synsets(input)
-        names_synsets = []
-        for i in synsets:
-            names_synsets.append(i.name())
-
-        return names_synsets
+        return list(_synset_names(input))
 
 
 # @nice_repr
@@ -171,24 +207,23 @@ class WordnetConcept(AlgorithmBase):
 
 @nice_repr
 class SentimentWord(AlgorithmBase):
-    """Find a word in SentiWordnet and return a List of sentiment of the word.
-    """
+    """Find a list of synsets in SentiWordnet and return their sentiment scores.
 
-    def __init__(self):
-        from nltk.corpus import sentiwordnet
-
-        self.swn = sentiwordnet
+    The output is a matrix with one row per synset, holding its positive
+    and negative scores, in that order.
+    """
 
-    def run(self, input: Synset) -> Sentiment:
-        """Find a word in SentiWordnet and return a List of sentiment of the word.
+    def run(self, input: Seq[Synset]) -> MatrixContinuousDense:
+        """Find a list of synsets in SentiWordnet and return their sentiment scores.
         """
-        swn_synset = self.swn.senti_synset(input)
+        sentiments = np.empty((len(input), 2), dtype=np.float32)
 
-        sentiment = {}
-        sentiment["positive"] = swn_synset.pos_score()
-        sentiment["negative"] = swn_synset.neg_score()
+        for i, synset in enumerate(input):
+            swn_synset = _senti_synset(synset)
+            sentiments[i, 0] = swn_synset.pos_score()
+            sentiments[i, 1] = swn_synset.neg_score()
 
-        return sentiment
+        return sentiments
 
 
 from nltk.chunk.named_entity import NEChunkParserTagger as _NEChunkParserTagger
@@ -218,64 +253,49 @@ class GlobalChunker(SklearnWrapper):
 
         SklearnWrapper.__init__(self)
 
+    def _postag(self, sentences):
+        # NLTK taggers can tag a whole batch at once, which avoids the
+        # per-call overhead of running the inner tagger sentence by sentence.
+        tagger = self.inner_trained_pos_tagger
+
+        if hasattr(tagger, "tag_sents"):
+            tagged = tagger.tag_sents(sentences)
+            return [[postag for _, postag in sentence] for sentence in tagged]
+
+        return [list(tagger.run(sentence)) if sentence else [] for sentence in sentences]
+
+    def _postag_document(self, X):
+        sentences = [list(sentence) for sentence in X]
+
+        return [
+            list(zip(sentence, postags))
+            for sentence, postags in zip(sentences, self._postag(sentences))
+            if sentence
+        ]
+
     def _train(self, X, y):
-        postagged_sentences = []
-        for i in range(len(X)):
-            sentence = []
-            for itoken in range(len(X[i])):
-                x_sent = X[i]
-                word = x_sent[itoken]
-                sentence.append(word)
-
-            postag_sentence = self.inner_trained_pos_tagger.run((sentence, sentence))[0]
-            tagged_sentence = [
-                (sentence[k], postag_sentence[k][1]) for k in range(len(sentence))
-            ]
-            if tagged_sentence:
-                postagged_sentences.append(tagged_sentence)
-
-        tagged_sentences = []
-        for i in range(len(y)):
-            sentence = []
-            tags = []
-            for itoken in range(len(y[i])):
-                y_sent = y[i]
-                word, tag = y_sent[itoken]
-                sentence.append(word)
-                tags.append(tag)
-
-            postag_sentence = self.inner_trained_pos_tagger.run((sentence, sentence))[0]
-            tagged_sentence = [
-                ((sentence[k], postag_sentence[k][1]), tags[k])
-                for k in range(len(sentence))
-            ]
-            if tagged_sentence:
-                tagged_sentences.append(tagged_sentence)
+        postagged_sentences = self._postag_document(X)
+
+        sentences = [[word for word, _ in sentence] for sentence in y]
+        tags = [[tag for _, tag in sentence] for sentence in y]
+
+        tagged_sentences = [
+            list(zip(zip(words, postags), chunktags))
+            for words, postags, chunktags in zip(
+                sentences, self._postag(sentences), tags
+            )
+            if words
+        ]
 
         return self.inner_chunker.run((postagged_sentences, tagged_sentences))
 
     def _eval(self, X, y=None):
-        postagged_document = []
-        for i in range(len(X)):
-            sentence = []
-            for itoken in range(len(X[i])):
-                x_sent = X[i]
-                word = x_sent[itoken]
-                sentence.append(word)
-
-            postag_sentence = self.inner_trained_pos_tagger.run((sentence, sentence))[0]
-            tagged_sentence = [
-                (sentence[k], postag_sentence[k][1]) for k in range(len(sentence))
-            ]
-            if tagged_sentence:
-                postagged_document.append(tagged_sentence)
-
-        return self.inner_chunker.run((postagged_document, y))
+        return self.inner_chunker.run((self._postag_document(X), y))
 
     def run(
         self, X: Seq[Seq[Word]], y: Supervised[Seq[Seq[Chunktag]]]
     ) -> Seq[Chunktag]:
-        return SklearnWrapper.run(self, input)
+        return SklearnWrapper.run(self, X, y)
 
 
 @nice_repr
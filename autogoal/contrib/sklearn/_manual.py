@@ -37,7 +37,7 @@ class CountVectorizerNoTokenize(_CountVectorizer, SklearnTransformer):
         def func(sentence):
             tokens = self.inner_tokenizer.run(sentence)
             tokens = (
-                self.inner_stopwords.run(sentence) if self.stopwords_remove else tokens
+                self.inner_stopwords.run(tokens) if self.stopwords_remove else tokens
             )
             return [self.inner_stemmer.run(token) for token in tokens]
 
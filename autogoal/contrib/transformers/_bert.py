@@ -1,5 +1,7 @@
+import contextlib
+
 from autogoal.kb import AlgorithmBase
-from transformers import BertModel, BertTokenizer
+from transformers import BertModel, BertTokenizer, BertTokenizerFast
 from pathlib import Path
 import torch
 import numpy as np
@@ -10,6 +12,23 @@ from autogoal.grammar import DiscreteValue, CategoricalValue
 from autogoal.utils import CacheManager, nice_repr
 
 
+def _inference_dtype(device):
+    """Half precision on GPU (bf16 when supported), full precision elsewhere."""
+    if device.type != "cuda":
+        return torch.float32
+
+    return torch.bfloat16 if torch.cuda.is_bf16_supported() else torch.float16
+
+
+def _autocast(device, dtype):
+    # Even disabled, CPU autocast warns about float32 on some torch versions.
+    # An empty `ExitStack` is a no-op context (`nullcontext` needs Python 3.7).
+    if device.type != "cuda":
+        return contextlib.ExitStack()
+
+    return torch.autocast(device_type=device.type, dtype=dtype)
+
+
 @nice_repr
 class BertEmbedding(AlgorithmBase):
     """
@@ -50,8 +69,9 @@ class BertEmbedding(AlgorithmBase):
         self.device = (
             torch.device("cuda") if torch.cuda.is_available() else torch.device("cpu")
         )
+        self.dtype = _inference_dtype(self.device)
         self.verbose = verbose
-        self.print("Using device: %s" % self.device)
+        self.print("Using device: %s (%s)" % (self.device, self.dtype))
         self.merge_mode = merge_mode
         self.model = None
         self.tokenizer = None
@@ -79,7 +99,7 @@ class BertEmbedding(AlgorithmBase):
             try:
                 self.model = BertModel.from_pretrained(
                     "bert-base-multilingual-cased", local_files_only=True
-                ).to(self.device)
+                ).to(self.device, dtype=self.dtype)
                 self.tokenizer = BertTokenizer.from_pretrained(
                     "bert-base-multilingual-cased", local_files_only=True
                 )
@@ -91,11 +111,11 @@ class BertEmbedding(AlgorithmBase):
         bert_tokens = [self.tokenizer.tokenize(x) for x in input]
         bert_sequence = self.tokenizer.encode_plus(
             [t for tokens in bert_tokens for t in tokens], return_tensors="pt"
-        )
+        ).to(self.device)
 
-        with torch.no_grad():
+        with torch.inference_mode(), _autocast(self.device, self.dtype):
             output = self.model(**bert_sequence).last_hidden_state
-            output = output.squeeze(0)
+            output = output.squeeze(0).float().cpu()
 
         count = 0
         matrix = []
@@ -139,8 +159,9 @@ class BertTokenizeEmbedding(AlgorithmBase):
         self.device = (
             torch.device("cuda") if torch.cuda.is_available() else torch.device("cpu")
         )
+        self.dtype = _inference_dtype(self.device)
         self.verbose = verbose
-        self.print("Using device: %s" % self.device)
+        self.print("Using device: %s (%s)" % (self.device, self.dtype))
         self.model = None
         self.tokenizer = None
 
@@ -155,8 +176,8 @@ class BertTokenizeEmbedding(AlgorithmBase):
             try:
                 self.model = BertModel.from_pretrained(
                     "bert-base-multilingual-cased", local_files_only=True
-                ).to(self.device)
-                self.tokenizer = BertTokenizer.from_pretrained(
+                ).to(self.device, dtype=self.dtype)
+                self.tokenizer = BertTokenizerFast.from_pretrained(
                     "bert-base-multilingual-cased", local_files_only=True
                 )
             except OSError:
@@ -165,16 +186,23 @@ class BertTokenizeEmbedding(AlgorithmBase):
                 )
 
         self.print("Tokenizing...", end="", flush=True)
-        tokens = [
-            self.tokenizer(x, max_length=32, pad_to_max_length=True) for x in input
-        ]
+        tokens = self.tokenizer(
+            list(input),
+            padding="max_length",
+            truncation=True,
+            max_length=32,
+            return_tensors="pt",
+        )
         self.print("done")
 
-        ids = torch.tensor(tokens).to(self.device)
+        input_ids = tokens["input_ids"].to(self.device)
+        attention_mask = tokens["attention_mask"].to(self.device)
 
-        with torch.no_grad():
+        with torch.inference_mode(), _autocast(self.device, self.dtype):
             self.print("Embedding...", end="", flush=True)
-            output = self.model(ids)[0].numpy()
+            output = self.model(
+                input_ids=input_ids, attention_mask=attention_mask
+            ).last_hidden_state
             self.print("done")
 
-        return output
+        return output.float().cpu().numpy()
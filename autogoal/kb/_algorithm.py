@@ -62,11 +62,7 @@ def algorithm(*annotations):
         if not hasattr(cls, "run"):
             return False
 
-        signature = inspect.signature(cls.run)
-        input_types = [
-            v.annotation for k, v in signature.parameters.items() if k != "self"
-        ]
-        output_type = signature.return_annotation
+        _, input_types, output_type = _run_annotations(cls)
 
         if len(inputs) != len(input_types):
             return False
@@ -171,30 +167,55 @@ class AlgorithmBase(Algorithm):
 
     @classmethod
     def input_types(cls) -> Tuple[type]:
-        # if not hasattr(cls, "__run_signature__"):
-        #     cls.__run_signature__ = inspect.signature(cls.run)
-
-        return tuple(
-            param.annotation
-            for name, param in inspect.signature(cls.run).parameters.items()
-            if name != "self"
-        )
+        return _run_annotations(cls)[1]
 
     @classmethod
     def input_args(cls) -> Tuple[str]:
-        # if not hasattr(cls, "__run_signature__"):
-        #     cls.__run_signature__ = inspect.signature(cls.run)
-
-        return tuple(
-            name for name in inspect.signature(cls.run).parameters if name != "self"
-        )
+        return _run_annotations(cls)[0]
 
     @classmethod
     def output_type(cls) -> type:
-        # if not hasattr(cls, "__run_signature__"):
-        #     cls.__run_signature__ = inspect.signature(cls.run)
+        return _run_annotations(cls)[2]
+
+
+def _run_annotations(cls):
+    """Returns the argument names, input types and output type of `cls.run`.
+
+    The result is computed once and stored in the class itself, since `inspect.signature`
+    is by far the most expensive step when checking compatibility during pipeline graph construction.
+    Each class keeps its own copy, so subclasses that override `run` are not affected:
+
+    >>> class A(AlgorithmBase):
+    ...     def run(self, x:int) -> float:
+    ...         pass
+    >>> class B(A):
+    ...     def run(self, x:str) -> int:
+    ...         pass
+    >>> _run_annotations(A)
+    (('x',), (<class 'int'>,), <class 'float'>)
+    >>> _run_annotations(B)
+    (('x',), (<class 'str'>,), <class 'int'>)
+
+    """
+    try:
+        return cls.__dict__["__run_annotations__"]
+    except KeyError:
+        pass
 
-        return inspect.signature(cls.run).return_annotation
+    signature = inspect.signature(cls.run)
+    parameters = [
+        (name, param.annotation)
+        for name, param in signature.parameters.items()
+        if name != "self"
+    ]
+    annotations = (
+        tuple(name for name, _ in parameters),
+        tuple(annotation for _, annotation in parameters),
+        signature.return_annotation,
+    )
+
+    setattr(cls, "__run_annotations__", annotations)
+    return annotations
 
 
 def build_input_args(algorithm: Algorithm, values: Dict[type, Any]):
@@ -380,11 +401,16 @@ def _make_list_args_and_kwargs(*args, **kwargs):
 
 
 class PipelineNode:
+    # Nodes are hashed and compared constantly while building the pipeline graph,
+    # so the hash is computed once, and only from the fields that `__eq__` uses.
+    __slots__ = ("algorithm", "input_types", "output_types", "grammar", "_hash")
+
     def __init__(self, algorithm, input_types, output_types, registry=None) -> None:
         self.algorithm = algorithm
         self.input_types = set(input_types)
         self.output_types = set(output_types)
         self.grammar = generate_cfg(self.algorithm, registry=registry)
+        self._hash = hash((self.algorithm, frozenset(self.input_types)))
 
     def sample(self, sampler):
         return self.grammar.sample(sampler=sampler)
@@ -402,7 +428,7 @@ class PipelineNode:
         return f"<PipelineNode(algorithm={self.algorithm.__name__},input_types={[i.__name__ for i in self.input_types]},output_types={[o.__name__ for o in self.output_types]})>"
 
     def __hash__(self) -> int:
-        return hash(repr(self))
+        return self._hash
 
 
 class PipelineSpace(GraphSpace):
@@ -13,7 +13,7 @@
 
 # We will never really instantiate these classes, just use them for annotations.
 
-from functools import reduce
+from functools import lru_cache, reduce
 import inspect
 import copyreg
 from typing import Type
@@ -24,9 +24,16 @@ from typing import Type
 # matches its semantic definition.
 # We will define a metaclass to allow for `isinstance` and `issubclass` to work based on our semantic match definition,
 # and to leave space for implementing class-level `__getitem__` to allow for a generics kind-of notation.
+#
+# Subclass checks are the core operation when building pipeline graphs, and they are
+# repeated many times over the same pairs of types. Since semantic types are never
+# modified after creation (and specialized types are singletons), the metaclass memoizes
+# the result of every `issubclass` check.
 
 
 class SemanticTypeMeta(type):
+    __subclass_checks = {}
+
     def __instancecheck__(cls, instance) -> bool:
         return cls._match(instance)
 
@@ -37,6 +44,18 @@ class SemanticTypeMeta(type):
             return cls._specialize(args)
 
     def __subclasscheck__(cls, subclass: type) -> bool:
+        key = (cls, subclass)
+
+        try:
+            return SemanticTypeMeta.__subclass_checks[key]
+        except KeyError:
+            pass
+
+        result = cls._check_subclass(subclass)
+        SemanticTypeMeta.__subclass_checks[key] = result
+        return result
+
+    def _check_subclass(cls, subclass: type) -> bool:
         if hasattr(subclass, "_conforms") and subclass._conforms(cls):
             return True
 
@@ -76,7 +95,7 @@ class SemanticType(metaclass=SemanticTypeMeta):
         return cls._name()
 
     @staticmethod
-    def infer(x):
+    def infer(x, sequences=True):
         """Automatically determines the semantic type of a given value.
         
         >>> SemanticType.infer("word")
@@ -92,12 +111,42 @@ class SemanticType(metaclass=SemanticTypeMeta):
         >>> SemanticType.infer(np.ones(shape=(2,2)))
         Tensor[2, Continuous, Dense]
 
+        Sequences (lists, tuples or 1-D object arrays) are inferred from a sample of
+        their first elements, using the most general type among them.
+
+        >>> SemanticType.infer(["hello", "hello world"])
+        Seq[Sentence]
+        >>> SemanticType.infer(np.asarray(["hello world", "Hello. Bye."], dtype=object))
+        Seq[Document]
+        >>> SemanticType.infer([["hello", "world"], ["bye"]])
+        Seq[Seq[Word]]
+        >>> SemanticType.infer([[{"word": "hello"}, {"word": "world"}]])
+        Seq[Seq[FeatureSet]]
+
+        Only the first 64 elements are sampled, so a more general element
+        appearing later is not taken into account.
+
+        >>> SemanticType.infer(["w"] * 64 + ["two words"])
+        Seq[Word]
+
+        Pass `sequences=False` to skip sequence inference, e.g., for label arrays
+        that must be inferred as tensors.
+
+        >>> SemanticType.infer(np.asarray(["pos", "neg"], dtype=object), sequences=False)
+        Tensor[1, None, None]
+
         """
-        types = inspect.getmembers(inspect.getmodule(SemanticType), inspect.isclass)
+        seq_type = _infer_seq(x) if sequences else None
+
+        if seq_type is not None:
+            return seq_type
+
         best_type = SemanticType
 
-        for _, t in types:
-            if isinstance(x, t) and issubclass(t, best_type):
+        # Checking `issubclass` first is cheap (it is memoized), and lets us skip
+        # matching `x` against types that cannot improve on the current best.
+        for t in _inferable_types():
+            if issubclass(t, best_type) and isinstance(x, t):
                 best_type = t
 
         if best_type == SemanticType:
@@ -106,6 +155,41 @@ class SemanticType(metaclass=SemanticTypeMeta):
         return best_type
 
 
+@lru_cache(maxsize=None)
+def _inferable_types():
+    # The module members never change after import, so we only list them once.
+    return tuple(
+        t
+        for _, t in inspect.getmembers(inspect.getmodule(SemanticType), inspect.isclass)
+    )
+
+
+def _infer_seq(x, sample_size=64):
+    if isinstance(x, ndarray):
+        if x.dtype != object or x.ndim != 1:
+            return None
+    elif not isinstance(x, (list, tuple)):
+        return None
+
+    if len(x) == 0:
+        return None
+
+    inner_type = None
+
+    for item in x[:sample_size]:
+        try:
+            item_type = SemanticType.infer(item)
+        except ValueError:
+            return None
+
+        if inner_type is None or issubclass(inner_type, item_type):
+            inner_type = item_type
+        elif not issubclass(item_type, inner_type):
+            return None
+
+    return Seq[inner_type]
+
+
 # To be able to serialize these types, we have to register a reduce function for `SemanticTypeMeta`.
 # This reduce function will just dispatch to the proper instance method
 
@@ -178,7 +262,7 @@ class FeatureSet(SemanticType):
     @classmethod
     def _match(self, x):
         # TODO: This is a very naive implementation of `match`.
-        return isinstance(x, dict) and isinstance(list(x.keys()[0]), str)
+        return isinstance(x, dict) and len(x) > 0 and isinstance(next(iter(x)), str)
 
 
 # A first complex type we can implement is `Seq`, to represent a list (or sequence) of another semantic type.
@@ -251,7 +335,13 @@ class Seq(SemanticType):
 
             @classmethod
             def _match(cls, x):
-                return isinstance(x, (list, tuple)) and internal_type._match(x[0])
+                if isinstance(x, ndarray):
+                    if x.dtype != object or x.ndim != 1:
+                        return False
+                elif not isinstance(x, (list, tuple)):
+                    return False
+
+                return len(x) > 0 and internal_type._match(x[0])
 
             @classmethod
             def _conforms(cls, other):
@@ -1,6 +1,10 @@
+import copy
+import functools
 import io
+import os
 import pickle
 import statistics
+from concurrent.futures import ThreadPoolExecutor
 
 import numpy as np
 from autogoal.contrib import find_classes
@@ -11,6 +15,20 @@ from autogoal.search import PESearch
 from autogoal.utils import nice_repr
 
 
+# Aggregation of cross validation scores is done in numpy for the usual cases,
+# any other name is looked up in the `statistics` module.
+_CROSS_VALIDATION_AGGREGATES = {"mean": np.mean, "median": np.median}
+
+
+@functools.lru_cache(maxsize=8)
+def _cached_pipeline_graph(input_types, output_type, registry):
+    # Building the graph dominates the startup of `fit`, and it only depends on
+    # these arguments, so repeated fits (e.g., in notebooks) reuse it.
+    return build_pipeline_graph(
+        input_types=input_types, output_type=output_type, registry=list(registry),
+    )
+
+
 @nice_repr
 class AutoML:
     """
@@ -18,6 +36,12 @@ class AutoML:
 
     An `AutoML` instance represents a general-purpose machine learning
     algorithm, that can be applied to any input and output.
+
+    Cross validation folds are evaluated sequentially by default. With
+    `cross_validation_jobs > 1` they are evaluated in that many threads,
+    each one on a copy of the pipeline, and `cross_validation_jobs=-1` uses
+    one thread per CPU. This pays off for pipelines that
+    release the GIL (e.g., most `sklearn`, `torch` or `gensim` algorithms).
     """
 
     def __init__(
@@ -33,6 +57,7 @@ class AutoML:
         errors="warn",
         cross_validation="median",
         cross_validation_steps=3,
+        cross_validation_jobs=1,
         registry=None,
         score_metric=None,
         **search_kwargs
@@ -47,12 +72,21 @@ class AutoML:
         self.errors = errors
         self.cross_validation = cross_validation
         self.cross_validation_steps = cross_validation_steps
+        self.cross_validation_jobs = cross_validation_jobs
         self.registry = registry
         self.random_state = random_state
         self.score_metric = score_metric or accuracy
         self.search_kwargs = search_kwargs
         self._unpickled = False
 
+        if cross_validation_jobs == -1:
+            self.cross_validation_jobs = os.cpu_count() or 1
+        elif cross_validation_jobs < 1:
+            raise ValueError(
+                "`cross_validation_jobs` must be a positive integer or -1, got %r"
+                % cross_validation_jobs
+            )
+
         if random_state:
             np.random.seed(random_state)
 
@@ -67,9 +101,9 @@ class AutoML:
             include=self.include_filter, exclude=self.exclude_filter
         )
 
-        return build_pipeline_graph(
-            input_types=self.input, output_type=self.output, registry=registry,
-        )
+        input_types = tuple(self.input) if isinstance(self.input, list) else self.input
+
+        return _cached_pipeline_graph(input_types, self.output, tuple(registry))
 
     def fit(self, X, y, **kwargs):
         self.input = self._input_type(X)
@@ -120,51 +154,77 @@ class AutoML:
     def score(self, X, y):
         self._check_fitted()
 
-        y_pred = self.best_pipeline_.run(X, np.zeros_like(y))
+        y_pred = self.best_pipeline_.run(X, None)
         return self.score_metric(y, y_pred)
 
     def _input_type(self, X):
         return self.input or SemanticType.infer(X)
 
     def _output_type(self, y):
-        return self.output or SemanticType.infer(y)
+        # Labels often come as 1-D object arrays (e.g., pandas `.values`), which
+        # must be inferred as tensors for classifiers to match them.
+        return self.output or SemanticType.infer(y, sequences=False)
 
     def make_fitness_fn(self, X, y):
         y = np.asarray(y)
+        rng = np.random.default_rng(self.random_state)
+        len_x = len(X) if isinstance(X, list) else X.shape[0]
+        split_index = int(self.validation_split * len_x)
+
+        aggregate = _CROSS_VALIDATION_AGGREGATES.get(self.cross_validation) or getattr(
+            statistics, self.cross_validation
+        )
+
+        def evaluate_fold(pipeline, indices):
+            train_indices = indices[:-split_index]
+            test_indices = indices[-split_index:]
+
+            if isinstance(X, list):
+                X_train, y_train, X_test, y_test = (
+                    [X[i] for i in train_indices],
+                    y[train_indices],
+                    [X[i] for i in test_indices],
+                    y[test_indices],
+                )
+            else:
+                X_train, y_train, X_test, y_test = (
+                    X[train_indices],
+                    y[train_indices],
+                    X[test_indices],
+                    y[test_indices],
+                )
+
+            pipeline.send("train")
+            pipeline.run(X_train, y_train)
+            pipeline.send("eval")
+            y_pred = pipeline.run(X_test, None)
+            return self.score_metric(y_test, y_pred)
+
+        def evaluate_fold_copy(pipeline, indices):
+            # Each thread trains its own copy, since pipelines are stateful
+            return evaluate_fold(copy.deepcopy(pipeline), indices)
 
         def fitness_fn(pipeline):
-            scores = []
-
-            for _ in range(self.cross_validation_steps):
-                len_x = len(X) if isinstance(X, list) else X.shape[0]
-                indices = np.arange(0, len_x)
-                np.random.shuffle(indices)
-                split_index = int(self.validation_split * len(indices))
-                train_indices = indices[:-split_index]
-                test_indices = indices[-split_index:]
-
-                if isinstance(X, list):
-                    X_train, y_train, X_test, y_test = (
-                        [X[i] for i in train_indices],
-                        y[train_indices],
-                        [X[i] for i in test_indices],
-                        y[test_indices],
-                    )
-                else:
-                    X_train, y_train, X_test, y_test = (
-                        X[train_indices],
-                        y[train_indices],
-                        X[test_indices],
-                        y[test_indices],
+            # Splits are drawn upfront, as the generator is not thread-safe
+            folds = [
+                rng.permutation(len_x) for _ in range(self.cross_validation_steps)
+            ]
+            scores = np.empty(self.cross_validation_steps, dtype=np.float64)
+
+            if self.cross_validation_jobs == 1:
+                for step, indices in enumerate(folds):
+                    scores[step] = evaluate_fold(pipeline, indices)
+            else:
+                with ThreadPoolExecutor(
+                    max_workers=self.cross_validation_jobs
+                ) as executor:
+                    scores[:] = list(
+                        executor.map(
+                            evaluate_fold_copy, [pipeline] * len(folds), folds
+                        )
                     )
 
-                pipeline.send("train")
-                pipeline.run(X_train, y_train)
-                pipeline.send("eval")
-                y_pred = pipeline.run(X_test, None)
-                scores.append(self.score_metric(y_test, y_pred))
-
-            return getattr(statistics, self.cross_validation)(scores)
+            return aggregate(scores)
 
         return fitness_fn
 
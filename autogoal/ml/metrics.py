@@ -27,4 +27,23 @@ def find_metric(*types):
 
 
 def accuracy(ytrue, ypred) -> float:
-    return np.mean([1 if yt == yp else 0 for yt, yp in zip(ytrue, ypred)])
+    """
+    Computes the fraction of predictions that match the ground truth.
+
+    ```python
+    >>> accuracy(np.asarray([0, 1, 1, 0]), np.asarray([0, 1, 0, 0]))
+    0.75
+    >>> accuracy([[0, 1], [1]], [[0, 1], [0]])
+    0.5
+
+    ```
+    """
+    if (
+        isinstance(ytrue, np.ndarray)
+        and isinstance(ypred, np.ndarray)
+        and ytrue.ndim == 1
+        and ytrue.shape == ypred.shape
+    ):
+        return float(np.mean(ytrue == ypred))
+
+    return float(np.mean([1 if yt == yp else 0 for yt, yp in zip(ytrue, ypred)]))
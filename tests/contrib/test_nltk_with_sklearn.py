@@ -44,3 +44,161 @@ def test_crf_pipeline():
     )
 
     pipeline = graph.sample()
+
+
+from autogoal.contrib.nltk import GlobalChunker, PerceptronTagger
+
+
+class RecordingChunker:
+    def run(self, input):
+        self.input = input
+        return input
+
+
+def test_global_chunker_bulk_tagging_matches_per_sentence_tagging():
+    X = [["The", "dog", "barks"], [], ["A", "cat", "sleeps", "."]]
+    y = [
+        [("The", "B-NP"), ("dog", "I-NP"), ("barks", "O")],
+        [],
+        [("A", "B-NP"), ("cat", "I-NP"), ("sleeps", "O"), (".", "O")],
+    ]
+
+    tagger = PerceptronTagger()
+    inner_chunker = RecordingChunker()
+    chunker = GlobalChunker(
+        inner_trained_pos_tagger=tagger, inner_chunker=inner_chunker
+    )
+
+    # The expected values tag one sentence at a time, as the chunker used to
+    postagged = [tagger.tag(sentence) for sentence in X if sentence]
+    tagged = [
+        [
+            ((word, postag), chunktag)
+            for (word, postag), (_, chunktag) in zip(
+                tagger.tag([word for word, _ in sentence]), sentence
+            )
+        ]
+        for sentence in y
+        if sentence
+    ]
+
+    chunker.train()
+    chunker.run(X, y)
+    assert inner_chunker.input == (postagged, tagged)
+
+    chunker.eval()
+    chunker.run(X, None)
+    assert inner_chunker.input == (postagged, None)
+
+
+class WordLengthTagger:
+    def run(self, input):
+        return ["LONG" if len(word) > 3 else "SHORT" for word in input]
+
+
+def test_global_chunker_tags_with_run_only_taggers():
+    X = [["The", "dog", "barks"], []]
+    y = [[("The", "B-NP"), ("dog", "I-NP"), ("barks", "O")], []]
+
+    inner_chunker = RecordingChunker()
+    chunker = GlobalChunker(
+        inner_trained_pos_tagger=WordLengthTagger(), inner_chunker=inner_chunker
+    )
+
+    chunker.train()
+    chunker.run(X, y)
+    assert inner_chunker.input == (
+        [[("The", "SHORT"), ("dog", "SHORT"), ("barks", "LONG")]],
+        [
+            [
+                (("The", "SHORT"), "B-NP"),
+                (("dog", "SHORT"), "I-NP"),
+                (("barks", "LONG"), "O"),
+            ]
+        ],
+    )
+
+    chunker.eval()
+    chunker.run(X, None)
+    assert inner_chunker.input == (
+        [[("The", "SHORT"), ("dog", "SHORT"), ("barks", "LONG")]],
+        None,
+    )
+
+
+import numpy as np
+from nltk.corpus import sentiwordnet
+
+from autogoal.contrib.nltk import SentimentWord, WordnetConcept
+from autogoal.kb import MatrixContinuousDense
+
+
+def test_sentiment_word_returns_pos_neg_matrix():
+    synsets = ["good.a.01", "bad.a.01", "dog.n.01"]
+    sentiments = SentimentWord().run(synsets)
+
+    assert sentiments.shape == (3, 2)
+    assert sentiments.dtype == np.float32
+
+    for row, synset in zip(sentiments, synsets):
+        expected = sentiwordnet.senti_synset(synset)
+        assert row[0] == np.float32(expected.pos_score())
+        assert row[1] == np.float32(expected.neg_score())
+
+
+def test_sentiment_word_on_empty_input():
+    sentiments = SentimentWord().run([])
+
+    assert sentiments.shape == (0, 2)
+    assert sentiments.dtype == np.float32
+
+
+def test_wordnet_concept_connects_to_sentiment_word():
+    graph = build_pipeline_graph(
+        input_types=Word,
+        output_type=MatrixContinuousDense,
+        registry=[WordnetConcept, SentimentWord],
+    )
+
+    pipeline = graph.sample()
+
+    assert [type(algorithm) for algorithm in pipeline.algorithms] == [
+        WordnetConcept,
+        SentimentWord,
+    ]
+
+
+from autogoal.contrib.nltk import Doc2Vec
+
+
+class WhitespaceTokenizer:
+    def run(self, sentence):
+        return sentence.split()
+
+
+class IdentityStemmer:
+    def run(self, word):
+        return word
+
+
+def test_doc2vec_fit_gives_one_tag_per_document():
+    # More than 10 documents, so single-character tags would collide
+    X = ["the dog barks at the cat"] * 12
+
+    model = Doc2Vec(
+        dm=1,
+        dbow_words=0,
+        dm_concat=0,
+        dm_tag_count=1,
+        alpha=0.025,
+        epochs=2,
+        window=2,
+        inner_tokenizer=WhitespaceTokenizer(),
+        inner_stemmer=IdentityStemmer(),
+        inner_stopwords=None,
+        lowercase=False,
+        stopwords_remove=False,
+    )
+    model.fit(X, None)
+
+    assert len(model.docvecs) == len(X)
@@ -1,3 +1,5 @@
+import time
+
 import pytest
 
 import numpy as np
@@ -128,3 +130,69 @@ def test_automl_finds_classifiers():
     builder = automl.make_pipeline_builder()
 
     assert len(builder.graph) > 10
+
+
+class NearestMeanClassifier(AlgorithmBase):
+    def __init__(self):
+        self._mode = "train"
+        self._means = None
+
+    def train(self):
+        self._mode = "train"
+
+    def eval(self):
+        self._mode = "eval"
+
+    def run(
+        self, x: MatrixContinuousDense, y: Supervised[VectorCategorical]
+    ) -> VectorCategorical:
+        # Give other folds a chance to run in between, so that a pipeline
+        # shared across threads would be evaluated with the wrong means.
+        time.sleep(0.01)
+
+        if self._mode == "train":
+            self._means = np.stack([x[y == c].mean(axis=0) for c in [0, 1]])
+            return y
+
+        distances = ((x[:, None, :] - self._means[None, :, :]) ** 2).sum(axis=2)
+        return distances.argmin(axis=1)
+
+
+def test_parallel_cross_validation_matches_sequential():
+    rng = np.random.default_rng(0)
+    X = rng.random((100, 10))
+    y = (X[:, 0] + 0.5 * rng.random(100) > 0.75).astype(int)
+    scores = []
+
+    for jobs in [1, 3, -1]:
+        automl = AutoML(
+            input=(MatrixContinuousDense, Supervised[VectorCategorical]),
+            output=VectorCategorical,
+            random_state=0,
+            cross_validation="mean",
+            cross_validation_steps=6,
+            cross_validation_jobs=jobs,
+        )
+        fitness_fn = automl.make_fitness_fn(X, y)
+        pipeline = Pipeline(
+            [NearestMeanClassifier()],
+            input_types=[MatrixContinuousDense, Supervised[VectorCategorical]],
+        )
+        scores.append(fitness_fn(pipeline))
+
+    assert 0.5 < scores[0] < 1.0
+    assert scores[0] == scores[1] == scores[2]
+
+
+@pytest.mark.parametrize("jobs", [0, -2])
+def test_invalid_cross_validation_jobs_are_rejected(jobs):
+    with pytest.raises(ValueError):
+        AutoML(cross_validation_jobs=jobs)
+
+
+def test_automl_infers_object_label_arrays_as_vectors():
+    y = np.asarray(["pos", "neg", "pos"], dtype=object)
+    output_type = AutoML()._output_type(y)
+
+    assert output_type == Vector
+    assert not issubclass(output_type, Seq)